@@ -0,0 +1,137 @@
+"""
+Command-line interface for EXIF Renamer.
+
+Usage:
+    python -m exif_renamer --directory "2007 Print Quality" --destination "/path/to/destination"
+    python -m exif_renamer --current --destination "/path/to/destination"
+"""
+
+import argparse
+from pathlib import Path
+
+from exif_renamer import (
+    ARCHIVE_ROOT,
+    COPY_THREADS,
+    DEFAULT_DESTINATION,
+    VOLUME_PATH,
+    __version__,
+    cleanup_checkpoints,
+    ensure_photo_volume_mounted,
+    force_unmount,
+    is_volume_responsive,
+    traverse_and_rename,
+)
+
+
+def main():
+    """
+    Parses the command line and runs the rename over the selected directory.
+    """
+    parser = argparse.ArgumentParser(
+        prog="exif_renamer",
+        description="Rename image files based on their metadata.",
+        epilog=f"EXIF Renamer v{__version__} - Automated File Naming Tool"
+    )
+
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}"
+    )
+
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument(
+        "--directory",
+        help="Subdirectory under /Volumes/photo/shapfam/ to process (e.g., '2007 Print Quality')."
+    )
+    group.add_argument(
+        "--current",
+        action="store_true",
+        help="Use the current working directory as the root."
+    )
+
+    # Add report argument to parser:
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="Generate CSV report of files to be renamed instead of copying them."
+    )
+
+
+    # The destination is no longer a required parameter.
+    parser.add_argument(
+        "--destination",
+        help="The destination directory for the renamed files. Defaults to DEFAULT_DESTINATION if not provided."
+    )
+
+    parser.add_argument("--debug", action="store_true", help="Enable debug mode (print changes, don't write).")
+
+    parser.add_argument(
+        "--copy-threads",
+        type=int,
+        default=COPY_THREADS,
+        help=f"Number of files each worker process copies concurrently (default: {COPY_THREADS}). "
+             "Fast local SSDs benefit from more copies in flight."
+    )
+    args = parser.parse_args()
+
+    if args.current:
+        target_dir = Path.cwd()
+    else:
+        target_dir = ARCHIVE_ROOT / args.directory
+
+    if args.copy_threads < 1:
+        print("Error: --copy-threads must be at least 1.")
+        exit(1)
+
+    if not target_dir.exists():
+        print(f"Error: Source directory '{target_dir}' does not exist.")
+        exit(1)
+
+    # --- New Logic: Determine the final destination directory ---
+    # First, determine the base destination root.
+    if args.destination:
+        # If a destination is provided, use it.
+        destination_root = Path(args.destination)
+    else:
+        # Otherwise, use the predefined default.
+        destination_root = DEFAULT_DESTINATION
+
+    # Second, check if a subdirectory name needs to be appended.
+    if args.directory:
+        directory_name = Path(args.directory).name
+        # Append the directory name to the destination root.
+        destination_dir = destination_root / directory_name
+    else:
+        # If no --directory is specified, use the destination root as the final destination.
+        destination_dir = destination_root
+    
+    report_filename = None    
+    if args.report:
+        base_name = args.directory if args.directory else "rename_report"
+        report_filename = f"{base_name}_report.csv"
+        
+    # Ensure the final destination directory exists.
+    destination_dir.mkdir(parents=True, exist_ok=True)
+    
+    # --- On SMB root volume may need to be reopened ---
+    if not is_volume_responsive(VOLUME_PATH):
+        force_unmount(VOLUME_PATH)
+    # Ensure the volume is mounted
+    if not ensure_photo_volume_mounted():
+        print("Error: Volume not mounted. Please check your network connection and try again.")
+        exit(1)
+
+    print(f"Processing directory: {target_dir}")
+    print(f"Destination directory: {destination_dir}")
+
+    traverse_and_rename(target_dir, destination_dir, debug=args.debug, report_filename=report_filename,
+                        copy_threads=args.copy_threads)
+
+    # A debug run never creates checkpoints, so leave any from an interrupted real run in place.
+    if not args.debug:
+        cleanup_checkpoints(target_dir)
+
+
+if __name__ == "__main__":
+    main()